@@ -7,6 +7,7 @@ from typing import List
 import backoff
 import requests
 from eth_account.messages import encode_defunct
+from eth_hash.auto import keccak
 from eth_typing import BlockNumber, ChecksumAddress, HexStr
 from hexbytes import HexBytes
 from web3 import Web3
@@ -90,7 +91,7 @@ def validate_vote_signature(
 ) -> bool:
     """Checks whether vote was signed by specific Ethereum account."""
     try:
-        candidate_id: bytes = Web3.keccak(primitive=encoded_data)
+        candidate_id: bytes = keccak(encoded_data)
         message_hash = encode_defunct(primitive=candidate_id)
         signer = web3_client.eth.account.recover_message(
             message_hash, signature=signature
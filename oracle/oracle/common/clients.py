@@ -1,9 +1,13 @@
 import asyncio
 import logging
-from typing import Any, Dict, List
+from asyncio import AbstractEventLoop
+from typing import Any, AsyncIterator, Dict, List
+from weakref import WeakKeyDictionary
 
 import backoff
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from gql import Client
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
 from graphql import DocumentNode
 
@@ -20,6 +24,26 @@ EXECUTE_TIMEOUT = 45
 # set default GQL pagination
 PAGINATION_WINDOWS = 1000
 
+# shared HTTP connection pool settings
+CONNECTIONS_LIMIT = 200
+CONNECTIONS_LIMIT_PER_HOST = 32
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+# fail fast on unreachable hosts, keep aiohttp default for the total time
+HTTP_TIMEOUT = ClientTimeout(total=300, sock_connect=10)
+
+# HTTP connection pools and sessions per event loop
+_connectors: "WeakKeyDictionary[AbstractEventLoop, TCPConnector]" = WeakKeyDictionary()
+_http_sessions: "WeakKeyDictionary[AbstractEventLoop, ClientSession]" = (
+    WeakKeyDictionary()
+)
+
+# connecting or connected GQL sessions per event loop and subgraph URL
+_gql_sessions: "WeakKeyDictionary[AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    WeakKeyDictionary()
+)
+
 
 def get_network_config(network):
     try:
@@ -34,12 +58,85 @@ class GraphqlConsensusError(ConnectionError):
     pass
 
 
+def _get_connector() -> TCPConnector:
+    """Returns HTTP connection pool of the current event loop."""
+    loop = asyncio.get_running_loop()
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = TCPConnector(
+            limit=CONNECTIONS_LIMIT,
+            limit_per_host=CONNECTIONS_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+        _connectors[loop] = connector
+
+    return connector
+
+
+def get_http_session() -> ClientSession:
+    """Returns aiohttp session using the shared connection pool."""
+    loop = asyncio.get_running_loop()
+    session = _http_sessions.get(loop)
+    if session is None or session.closed:
+        session = ClientSession(
+            connector=_get_connector(), connector_owner=False, timeout=HTTP_TIMEOUT
+        )
+        _http_sessions[loop] = session
+
+    return session
+
+
+async def get_gql_session(subgraph_url: str) -> AsyncClientSession:
+    """Returns GQL session connected to the subgraph, reusing its connection pool."""
+    sessions = _gql_sessions.setdefault(asyncio.get_running_loop(), {})
+    task = sessions.get(subgraph_url)
+    if task is None:
+        # store the connection task before awaiting it, so that concurrent
+        # callers share the same session
+        task = asyncio.ensure_future(_connect_gql_session(subgraph_url))
+        sessions[subgraph_url] = task
+
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        if sessions.get(subgraph_url) is task:
+            del sessions[subgraph_url]
+        raise
+
+
+async def _connect_gql_session(subgraph_url: str) -> AsyncClientSession:
+    transport = AIOHTTPTransport(
+        url=subgraph_url,
+        client_session_args=dict(connector=_get_connector(), connector_owner=False),
+    )
+    client = Client(transport=transport, execute_timeout=EXECUTE_TIMEOUT)
+    return await client.connect_async()
+
+
+async def close_sessions() -> None:
+    """Closes HTTP and GQL sessions opened in the current event loop."""
+    loop = asyncio.get_running_loop()
+    tasks = _gql_sessions.pop(loop, {}).values()
+    for session in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(session, AsyncClientSession):
+            await session.client.close_async()
+
+    http_session = _http_sessions.pop(loop, None)
+    if http_session is not None:
+        await http_session.close()
+
+    connector = _connectors.pop(loop, None)
+    if connector is not None:
+        await connector.close()
+
+
 async def execute_single_gql_query(
     subgraph_url: str, query: DocumentNode, variables: Dict
 ):
-    transport = AIOHTTPTransport(url=subgraph_url)
-    async with Client(transport=transport, execute_timeout=EXECUTE_TIMEOUT) as session:
-        return await session.execute(query, variable_values=variables)
+    session = await get_gql_session(subgraph_url)
+    return await session.execute(query, variable_values=variables)
 
 
 async def execute_sw_gql_query(
@@ -76,25 +173,63 @@ async def execute_ethereum_gql_query(
     )
 
 
-async def _execute_base_gql_paginated_query(
+async def _iterate_base_gql_paginated_query(
     subgraph_urls: str, query: DocumentNode, variables: Dict, paginated_field: str
-) -> List:
-    """Executes GraphQL query."""
-    result: List[Any] = []
-    variables["last_id"] = ""
+) -> AsyncIterator[List]:
+    """
+    Executes GraphQL query and yields the pages as they are fetched.
+    The next page is requested before the current one is yielded,
+    so that its round trip overlaps with the page processing.
+    """
+    last_id = ""
+    next_page = _fetch_page(subgraph_urls, query, variables, last_id)
+    try:
+        while True:
+            chunks = (await next_page).get(paginated_field, [])
+            has_next_page = len(chunks) >= PAGINATION_WINDOWS
+            if has_next_page:
+                if chunks[-1]["id"] == last_id:
+                    # lagging subgraph returned the same page, the result would be partial
+                    raise GraphqlConsensusError(
+                        f"Pagination of {paginated_field} stalled at id {last_id}"
+                    )
+
+                last_id = chunks[-1]["id"]
+                next_page = _fetch_page(subgraph_urls, query, variables, last_id)
 
-    while True:
-        query_result: Dict = await execute_gql_query(
+            yield chunks
+            if not has_next_page:
+                return
+    finally:
+        next_page.cancel()
+
+
+def _fetch_page(
+    subgraph_urls: str, query: DocumentNode, variables: Dict, last_id: str
+) -> asyncio.Task:
+    return asyncio.create_task(
+        execute_gql_query(
             subgraph_urls=subgraph_urls,
             query=query,
-            variables=variables,
+            variables=dict(variables, last_id=last_id),
         )
-        chunks = query_result.get(paginated_field, [])
+    )
+
+
+async def _execute_base_gql_paginated_query(
+    subgraph_urls: str, query: DocumentNode, variables: Dict, paginated_field: str
+) -> List:
+    """Executes GraphQL query."""
+    result: List[Any] = []
+    async for chunks in _iterate_base_gql_paginated_query(
+        subgraph_urls=subgraph_urls,
+        query=query,
+        variables=variables,
+        paginated_field=paginated_field,
+    ):
         result.extend(chunks)
-        if len(chunks) < PAGINATION_WINDOWS:
-            return result
 
-        variables["last_id"] = chunks[-1]["id"]
+    return result
 
 
 async def execute_sw_gql_paginated_query(
@@ -108,6 +243,18 @@ async def execute_sw_gql_paginated_query(
     )
 
 
+def iterate_sw_gql_paginated_query(
+    network: str, query: DocumentNode, variables: Dict, paginated_field: str
+) -> AsyncIterator[List]:
+    """Yields the pages of the query without keeping all of them in memory."""
+    return _iterate_base_gql_paginated_query(
+        subgraph_urls=get_network_config(network)["STAKEWISE_SUBGRAPH_URLS"],
+        query=query,
+        variables=variables,
+        paginated_field=paginated_field,
+    )
+
+
 async def execute_uniswap_v3_paginated_gql_query(
     network: str, query: DocumentNode, variables: Dict, paginated_field: str
 ) -> List:
@@ -13,11 +13,15 @@ from oracle.oracle.common.graphql_queries import (
 )
 from oracle.oracle.distributor.common.types import DistributorVotingParameters
 from oracle.oracle.rewards.types import RewardsVotingParameters
+from oracle.oracle.utils import LimitedSizeDict
 from oracle.oracle.validators.types import ValidatorVotingParameters
 from oracle.settings import CONFIRMATION_BLOCKS, NETWORKS
 
 logger = logging.getLogger(__name__)
 
+# voting parameters at the finalized block do not change
+VOTING_PARAMETERS_CACHE = LimitedSizeDict(size_limit=8)
+
 
 class Block(TypedDict):
     block_number: BlockNumber
@@ -90,6 +94,10 @@ async def get_voting_parameters(
     network: str, block_number: BlockNumber
 ) -> VotingParameters:
     """Fetches rewards voting parameters."""
+    cache_key = (network, block_number)
+    if cache_key in VOTING_PARAMETERS_CACHE:
+        return VOTING_PARAMETERS_CACHE[cache_key]
+
     result: Dict = await execute_sw_gql_query(
         network=network,
         query=VOTING_PARAMETERS_QUERY,
@@ -133,20 +141,22 @@ async def get_voting_parameters(
         pool_balance=Wei(int(pool["balance"])),
     )
 
-    return VotingParameters(
+    voting_parameters = VotingParameters(
         rewards=rewards, distributor=distributor, validator=validator
     )
+    VOTING_PARAMETERS_CACHE[cache_key] = voting_parameters
+    return voting_parameters
 
 
 def _find_max_consensus(items, func):
+    """Returns the first item with the highest value reached by the majority."""
+    if not items:
+        return None
+
     majority = len(items) // 2 + 1
-    maximum = 0
-    result = None
-    for item in items:
-        if (
-            func(item) > maximum
-            and len([x for x in items if func(x) >= func(item)]) >= majority
-        ):
-            maximum = func(item)
-            result = item
-    return result
+    values = [func(item) for item in items]
+    maximum = sorted(values, reverse=True)[majority - 1]
+    if maximum <= 0:
+        return None
+
+    return items[values.index(maximum)]
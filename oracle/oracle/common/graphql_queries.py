@@ -112,12 +112,19 @@ ORACLE_QUERY = gql(
 """
 )
 
-DISABLED_STAKER_ACCOUNTS_QUERY = gql(
+REWARD_PER_STAKED_ETH_TOKEN_QUERY = gql(
     """
-    query getDisabledStakerAccounts($block_number: Int, $last_id: ID) {
+    query getRewardPerStakedEthToken($block_number: Int) {
       rewardEthTokens(block: { number: $block_number }) {
         rewardPerStakedEthToken
       }
+    }
+"""
+)
+
+DISABLED_STAKER_ACCOUNTS_QUERY = gql(
+    """
+    query getDisabledStakerAccounts($block_number: Int, $last_id: ID) {
       stakers(
         block: { number: $block_number }
         where: { id_gt: $last_id, rewardsDisabled: true }
@@ -340,6 +347,32 @@ DISTRIBUTOR_TOKENS_QUERY = gql(
 """
 )
 
+DISTRIBUTOR_TOKENS_AND_REDIRECTS_QUERY = gql(
+    """
+    query getDistributorTokensAndRedirects($block_number: Int) {
+      distributorTokens(
+        block: { number: $block_number }
+        first: 1000
+        orderBy: id
+        orderDirection: asc
+      ) {
+        id
+      }
+      distributorRedirects(
+        block: { number: $block_number }
+        first: 1000
+        orderBy: id
+        orderDirection: asc
+      ) {
+        id
+        token {
+          id
+        }
+      }
+    }
+"""
+)
+
 DISTRIBUTOR_TOKEN_HOLDERS_QUERY = gql(
     """
     query getDistributorTokenHolders(
@@ -445,10 +478,11 @@ PARTNERS_QUERY = gql(
 
 VALIDATOR_REGISTRATIONS_QUERY = gql(
     """
-    query getValidatorRegistrations($block_number: Int, $public_key: Bytes) {
+    query getValidatorRegistrations($block_number: Int, $public_keys: [Bytes!]) {
       validatorRegistrations(
         block: { number: $block_number }
-        where: { publicKey: $public_key }
+        where: { publicKey_in: $public_keys }
+        first: 1000
       ) {
         publicKey
       }
@@ -1,10 +1,15 @@
+import asyncio
+import json
 import logging
+from asyncio import AbstractEventLoop
 from typing import Any, Dict, List, Union
+from weakref import WeakKeyDictionary
 
 import backoff
-import ipfshttpclient
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import BasicAuth, ClientSession, ClientTimeout
+from ipfshttpclient.http_common import multiaddr_to_url_data
 
+from oracle.oracle.common.clients import get_http_session
 from oracle.oracle.utils import LimitedSizeDict
 from oracle.settings import (
     INFURA_IPFS_CLIENT_ENDPOINT,
@@ -21,8 +26,67 @@ timeout = ClientTimeout(total=180)
 CACHE_SIZE = 1024
 IPFS_CACHE = LimitedSizeDict(size_limit=CACHE_SIZE)
 
+# IPFS fetches in progress per event loop and hash
+_pending_fetches: "WeakKeyDictionary[AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    WeakKeyDictionary()
+)
+
+
+async def _gateway_fetch(session: ClientSession, endpoint: str, ipfs_hash: str) -> Any:
+    async with session.get(
+        f"{endpoint.rstrip('/')}/ipfs/{ipfs_hash}", timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def _gateways_fetch(ipfs_hash: str) -> Any:
+    """Requests all the gateways and the local node at once and returns the first fetched data."""
+    session = get_http_session()
+    fetches = [
+        _gateway_fetch(session, endpoint, ipfs_hash)
+        for endpoint in IPFS_FETCH_ENDPOINTS
+    ]
+    if LOCAL_IPFS_CLIENT_ENDPOINT:
+        # local node serves pinned and previously fetched content from its own store
+        fetches.append(_api_fetch(session, LOCAL_IPFS_CLIENT_ENDPOINT, ipfs_hash))
+
+    pending = {asyncio.create_task(fetch) for fetch in fetches}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    data = task.result()
+                except BaseException as e:  # noqa: E722
+                    logger.exception(e)
+                    continue
+
+                if data:
+                    return data
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return None
+
+
+async def _api_fetch(
+    session: ClientSession,
+    endpoint: str,
+    ipfs_hash: str,
+    auth: Union[BasicAuth, None] = None,
+) -> Any:
+    base_url, _, _, _ = multiaddr_to_url_data(endpoint, "/api/v0")
+    async with session.post(
+        f"{base_url}cat", params={"arg": ipfs_hash}, auth=auth, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        return json.loads(await response.read())
+
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def ipfs_fetch(ipfs_hash: str) -> Union[Dict[Any, Any], List[Dict[Any, Any]]]:
     """Tries to fetch IPFS hash from different sources."""
     _ipfs_hash = ipfs_hash.replace("ipfs://", "").replace("/ipfs/", "")
@@ -30,33 +94,36 @@ async def ipfs_fetch(ipfs_hash: str) -> Union[Dict[Any, Any], List[Dict[Any, Any
     if IPFS_CACHE.get(_ipfs_hash):
         return IPFS_CACHE.get(_ipfs_hash)
 
-    async def _fetch(_ipfs_hash):
-        async with ClientSession(timeout=timeout) as session:
-            for endpoint in IPFS_FETCH_ENDPOINTS:
-                try:
-                    response = await session.get(
-                        f"{endpoint.rstrip('/')}/ipfs/{_ipfs_hash}"
-                    )
-                    response.raise_for_status()
-                    return await response.json()
-                except BaseException as e:  # noqa: E722
-                    logger.exception(e)
+    # share the fetch between the concurrent requests of the same hash
+    pending_fetches = _pending_fetches.setdefault(asyncio.get_running_loop(), {})
+    task = pending_fetches.get(_ipfs_hash)
+    if task is None:
+        task = asyncio.ensure_future(_ipfs_fetch(_ipfs_hash))
+        task.add_done_callback(lambda _: pending_fetches.pop(_ipfs_hash, None))
+        pending_fetches[_ipfs_hash] = task
+
+    # the caller cancellation must not cancel the fetch of the others
+    return await asyncio.shield(task)
+
 
-        if LOCAL_IPFS_CLIENT_ENDPOINT:
-            try:
-                with ipfshttpclient.connect(LOCAL_IPFS_CLIENT_ENDPOINT) as client:
-                    return client.get_json(_ipfs_hash)
-            except BaseException as e:  # noqa: E722
-                logger.exception(e)
+@backoff.on_exception(backoff.expo, Exception, max_time=900)
+async def _ipfs_fetch(_ipfs_hash: str) -> Union[Dict[Any, Any], List[Dict[Any, Any]]]:
+    """Fetches IPFS hash and saves it to the cache."""
+
+    async def _fetch(_ipfs_hash):
+        data = await _gateways_fetch(_ipfs_hash)
+        if data:
+            return data
 
         try:
-            with ipfshttpclient.connect(
+            return await _api_fetch(
+                get_http_session(),
                 INFURA_IPFS_CLIENT_ENDPOINT,
-                username=INFURA_IPFS_CLIENT_USERNAME,
-                password=INFURA_IPFS_CLIENT_PASSWORD,
-                timeout=180,
-            ) as client:
-                return client.get_json(_ipfs_hash)
+                _ipfs_hash,
+                auth=BasicAuth(INFURA_IPFS_CLIENT_USERNAME, INFURA_IPFS_CLIENT_PASSWORD)
+                if INFURA_IPFS_CLIENT_USERNAME
+                else None,
+            )
         except BaseException as e:  # noqa: E722
             logger.exception(e)
 
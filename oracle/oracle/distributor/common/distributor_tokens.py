@@ -1,16 +1,22 @@
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import BlockNumber, ChecksumAddress
-from web3 import Web3
 
-from oracle.oracle.common.clients import execute_sw_gql_paginated_query
+from oracle.oracle.common.clients import (
+    PAGINATION_WINDOWS,
+    execute_sw_gql_paginated_query,
+    execute_sw_gql_query,
+    iterate_sw_gql_paginated_query,
+)
 from oracle.oracle.common.graphql_queries import (
     DISTRIBUTOR_REDIRECTS_QUERY,
     DISTRIBUTOR_TOKEN_HOLDERS_QUERY,
+    DISTRIBUTOR_TOKENS_AND_REDIRECTS_QUERY,
     DISTRIBUTOR_TOKENS_QUERY,
 )
 from oracle.oracle.distributor.common.types import Balances
+from oracle.oracle.utils import to_checksum_address
 
 
 async def get_distributor_redirects(
@@ -27,13 +33,7 @@ async def get_distributor_redirects(
         paginated_field="distributorRedirects",
     )
 
-    redirects: Dict[ChecksumAddress, ChecksumAddress] = {}
-    for redirect in distributor_redirects:
-        redirected_from = Web3.toChecksumAddress(redirect["id"])
-        redirected_to = Web3.toChecksumAddress(redirect["token"]["id"])
-        redirects[redirected_from] = redirected_to
-
-    return redirects
+    return _parse_distributor_redirects(distributor_redirects)
 
 
 async def get_distributor_tokens(
@@ -49,7 +49,33 @@ async def get_distributor_tokens(
         paginated_field="distributorTokens",
     )
 
-    return set(Web3.toChecksumAddress(t["id"]) for t in distributor_tokens)
+    return _parse_distributor_tokens(distributor_tokens)
+
+
+async def get_distributor_tokens_and_redirects(
+    network: str, block_number: BlockNumber
+) -> Tuple[Set[ChecksumAddress], Dict[ChecksumAddress, ChecksumAddress]]:
+    """Fetches distributor tokens and redirects in a single request."""
+    result: Dict = await execute_sw_gql_query(
+        network=network,
+        query=DISTRIBUTOR_TOKENS_AND_REDIRECTS_QUERY,
+        variables=dict(block_number=block_number),
+    )
+    distributor_tokens = result.get("distributorTokens", [])
+    distributor_redirects = result.get("distributorRedirects", [])
+
+    # fall back to the paginated queries when the first page is full
+    if len(distributor_tokens) >= PAGINATION_WINDOWS:
+        tokens = await get_distributor_tokens(network, block_number)
+    else:
+        tokens = _parse_distributor_tokens(distributor_tokens)
+
+    if len(distributor_redirects) >= PAGINATION_WINDOWS:
+        redirects = await get_distributor_redirects(network, block_number)
+    else:
+        redirects = _parse_distributor_redirects(distributor_redirects)
+
+    return tokens, redirects
 
 
 async def get_token_liquidity_points(
@@ -60,7 +86,7 @@ async def get_token_liquidity_points(
 ) -> Balances:
     """Fetches distributor token holders' balances."""
     lowered_token_address = token_address.lower()
-    positions: List = await execute_sw_gql_paginated_query(
+    pages = iterate_sw_gql_paginated_query(
         network=network,
         query=DISTRIBUTOR_TOKEN_HOLDERS_QUERY,
         variables=dict(
@@ -70,28 +96,46 @@ async def get_token_liquidity_points(
         paginated_field="distributorTokenHolders",
     )
 
-    # process balances
+    # process balances page by page
     points: Dict[ChecksumAddress, int] = {}
     total_points = 0
-    for position in positions:
-        account = Web3.toChecksumAddress(position["account"])
-        if account == EMPTY_ADDR_HEX:
-            continue
-
-        principal = int(position["amount"])
-        prev_account_points = int(position["distributorPoints"])
-        updated_at_block = BlockNumber(int(position["updatedAtBlock"]))
-        if from_block > updated_at_block:
-            updated_at_block = from_block
-            prev_account_points = 0
-
-        account_points = prev_account_points + (
-            principal * (to_block - updated_at_block)
-        )
-        if account_points <= 0:
-            continue
-
-        points[account] = points.get(account, 0) + account_points
-        total_points += account_points
+    async for positions in pages:
+        for position in positions:
+            # subgraph returns lowercase addresses, checksum only the accounts with points
+            if position["account"] == EMPTY_ADDR_HEX:
+                continue
+
+            principal = int(position["amount"])
+            prev_account_points = int(position["distributorPoints"])
+            updated_at_block = BlockNumber(int(position["updatedAtBlock"]))
+            if from_block > updated_at_block:
+                updated_at_block = from_block
+                prev_account_points = 0
+
+            account_points = prev_account_points + (
+                principal * (to_block - updated_at_block)
+            )
+            if account_points <= 0:
+                continue
+
+            account = to_checksum_address(position["account"])
+            points[account] = points.get(account, 0) + account_points
+            total_points += account_points
 
     return Balances(total_supply=total_points, balances=points)
+
+
+def _parse_distributor_tokens(distributor_tokens: List) -> Set[ChecksumAddress]:
+    return set(to_checksum_address(t["id"]) for t in distributor_tokens)
+
+
+def _parse_distributor_redirects(
+    distributor_redirects: List,
+) -> Dict[ChecksumAddress, ChecksumAddress]:
+    redirects: Dict[ChecksumAddress, ChecksumAddress] = {}
+    for redirect in distributor_redirects:
+        redirected_from = to_checksum_address(redirect["id"])
+        redirected_to = to_checksum_address(redirect["token"]["id"])
+        redirects[redirected_from] = redirected_to
+
+    return redirects
@@ -1,9 +1,9 @@
+import asyncio
 import logging
 from typing import Dict, List, Tuple
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import ChecksumAddress, HexStr
-from web3 import Web3
 from web3.types import BlockNumber, Wei
 
 from oracle.oracle.common.clients import (
@@ -17,6 +17,7 @@ from oracle.oracle.common.graphql_queries import (
     OPERATORS_REWARDS_QUERY,
     PARTNERS_QUERY,
     PERIODIC_DISTRIBUTIONS_QUERY,
+    REWARD_PER_STAKED_ETH_TOKEN_QUERY,
 )
 from oracle.oracle.distributor.common.ipfs import get_one_time_rewards_allocations
 from oracle.oracle.distributor.common.types import (
@@ -28,6 +29,7 @@ from oracle.oracle.distributor.common.types import (
     TokenAllocations,
 )
 from oracle.oracle.distributor.rewards import DistributorRewards
+from oracle.oracle.utils import to_checksum_address
 
 logger = logging.getLogger(__name__)
 
@@ -55,10 +57,10 @@ async def get_periodic_allocations(
         allocation = TokenAllocation(
             from_block=dist_start_block,
             to_block=dist_end_block,
-            reward_token=Web3.toChecksumAddress(dist["token"]),
+            reward_token=to_checksum_address(dist["token"]),
             reward=int(dist["amount"]),
         )
-        allocations.setdefault(Web3.toChecksumAddress(dist["beneficiary"]), []).append(
+        allocations.setdefault(to_checksum_address(dist["beneficiary"]), []).append(
             allocation
         )
 
@@ -77,26 +79,19 @@ async def get_disabled_stakers_reward_token_distributions(
     if distributor_reward <= 0:
         return []
 
-    last_id = ""
-    result: Dict = await execute_sw_gql_query(
-        network=network,
-        query=DISABLED_STAKER_ACCOUNTS_QUERY,
-        variables=dict(block_number=to_block, last_id=last_id),
-    )
-    stakers_chunk = result.get("stakers", [])
-    stakers = stakers_chunk
-
-    # accumulate chunks of validators
-    while len(stakers_chunk) >= 1000:
-        last_id = stakers_chunk[-1]["id"]
-        result_stakers: Dict = await execute_sw_gql_query(
+    result, stakers = await asyncio.gather(
+        execute_sw_gql_query(
+            network=network,
+            query=REWARD_PER_STAKED_ETH_TOKEN_QUERY,
+            variables=dict(block_number=to_block),
+        ),
+        execute_sw_gql_paginated_query(
             network=network,
             query=DISABLED_STAKER_ACCOUNTS_QUERY,
-            variables=dict(block_number=to_block, last_id=last_id),
-        )
-        stakers_chunk = result_stakers.get("stakers", [])
-        stakers.extend(stakers_chunk)
-
+            variables=dict(block_number=to_block),
+            paginated_field="stakers",
+        ),
+    )
     reward_per_token: Wei = Wei(
         int(result["rewardEthTokens"][0]["rewardPerStakedEthToken"])
     )
@@ -106,7 +101,7 @@ async def get_disabled_stakers_reward_token_distributions(
     principals: Dict[ChecksumAddress, Wei] = {}
     for staker in stakers:
         staker_reward_per_token: Wei = Wei(int(staker["rewardPerStakedEthToken"]))
-        staker_address: ChecksumAddress = Web3.toChecksumAddress(staker["id"])
+        staker_address: ChecksumAddress = to_checksum_address(staker["id"])
         staker_principal: Wei = Wei(int(staker["principalBalance"]))
         if staker_reward_per_token >= reward_per_token or staker_principal <= 0:
             continue
@@ -158,7 +153,7 @@ async def get_distributor_claimed_accounts(
         variables=dict(merkle_root=merkle_root),
         paginated_field="merkleDistributorClaims",
     )
-    return set(Web3.toChecksumAddress(claim["account"]) for claim in claims)
+    return set(to_checksum_address(claim["account"]) for claim in claims)
 
 
 async def get_operators_rewards(
@@ -184,7 +179,7 @@ async def get_operators_rewards(
     total_points = 0
     total_validators = 0
     for operator in operators:
-        account = Web3.toChecksumAddress(operator["id"])
+        account = to_checksum_address(operator["id"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -252,7 +247,7 @@ async def get_partners_rewards(
     total_points = 0
     total_contributed = 0
     for partner in partners:
-        account = Web3.toChecksumAddress(partner["id"])
+        account = to_checksum_address(partner["id"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -353,7 +348,7 @@ async def get_one_time_rewards(
 
         total_amount = int(distribution["amount"])
         distributed_amount = 0
-        token = Web3.toChecksumAddress(distribution["token"])
+        token = to_checksum_address(distribution["token"])
         rewards: Rewards = {}
         try:
             allocated_rewards = await get_one_time_rewards_allocations(
@@ -1,8 +1,10 @@
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Union
 
 from eth_typing import ChecksumAddress
 from eth_typing.encoding import HexStr
+from eth_utils import is_address, to_canonical_address
 from eth_utils.crypto import keccak
 from web3 import Web3
 
@@ -97,6 +99,18 @@ class MerkleTree(object):
         return None
 
 
+def _encode_uint256(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+@lru_cache(maxsize=65536)
+def _encode_address(address: ChecksumAddress) -> bytes:
+    # same validation as the ABI codec, cached for the recurring addresses
+    if not is_address(address):
+        raise ValueError(f"Invalid address: {address}")
+    return to_canonical_address(address).rjust(32, b"\0")
+
+
 def get_merkle_node(
     index: int,
     tokens: List[ChecksumAddress],
@@ -104,11 +118,24 @@ def get_merkle_node(
     values: List[int],
 ) -> bytes:
     """Generates node for merkle tree."""
-    encoded_data: bytes = w3.codec.encode_abi(
-        ["uint256", "address[]", "address", "uint256[]"],
-        [index, tokens, account, values],
+    # ABI encoding of (uint256, address[], address, uint256[]) done by hand:
+    # the web3 codec re-validates every address checksum for every leaf,
+    # here the validated addresses are cached
+    tokens_offset = 4 * 32
+    values_offset = tokens_offset + 32 * (len(tokens) + 1)
+    encoded_data: bytes = b"".join(
+        [
+            _encode_uint256(index),
+            _encode_uint256(tokens_offset),
+            _encode_address(account),
+            _encode_uint256(values_offset),
+            _encode_uint256(len(tokens)),
+            *(_encode_address(token) for token in tokens),
+            _encode_uint256(len(values)),
+            *(_encode_uint256(value) for value in values),
+        ]
     )
-    return w3.keccak(primitive=encoded_data)
+    return keccak(primitive=encoded_data)
 
 
 def calculate_merkle_root(rewards: Rewards) -> Tuple[HexStr, Claims]:
@@ -1,10 +1,8 @@
 from math import ceil
 from typing import Dict, List
 
-import backoff
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import BlockNumber, ChecksumAddress
-from web3 import Web3
 
 from oracle.networks import GNOSIS_CHAIN, HARBOUR_GOERLI, HARBOUR_MAINNET
 from oracle.oracle.common.clients import (
@@ -25,6 +23,7 @@ from oracle.oracle.distributor.common.types import (
     TokenAllocations,
     UniswapV3Pools,
 )
+from oracle.oracle.utils import to_checksum_address
 
 # NB! Changing BLOCKS_INTERVAL while distributions are still active can lead to invalid allocations
 BLOCKS_INTERVAL: BlockNumber = BlockNumber(277)
@@ -35,7 +34,6 @@ Q32 = 2**32
 Q96 = 2**96
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def get_uniswap_v3_pools(
     network: str,
     block_number: BlockNumber,
@@ -64,9 +62,9 @@ async def get_uniswap_v3_pools(
         swise_pools=set(),
     )
     for pool in pools:
-        pool_address = Web3.toChecksumAddress(pool["id"])
-        pool_token0 = Web3.toChecksumAddress(pool["token0"])
-        pool_token1 = Web3.toChecksumAddress(pool["token1"])
+        pool_address = to_checksum_address(pool["id"])
+        pool_token0 = to_checksum_address(pool["token0"])
+        pool_token1 = to_checksum_address(pool["token1"])
         for pool_token in [pool_token0, pool_token1]:
             if pool_token == staked_token_address:
                 uni_v3_pools["staked_token_pools"].add(pool_address)
@@ -78,7 +76,6 @@ async def get_uniswap_v3_pools(
     return uni_v3_pools
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def get_uniswap_v3_distributions(
     pools: UniswapV3Pools,
     active_allocations: TokenAllocations,
@@ -114,42 +111,46 @@ async def get_uniswap_v3_distributions(
             interval_reward = reward_per_block * BLOCKS_INTERVAL
             start: BlockNumber = max(alloc_from_block, from_block)
             end: BlockNumber = min(alloc_to_block, to_block)
-            while start != end:
-                if start + BLOCKS_INTERVAL > end:
-                    interval = end - start
-                    reward = reward_per_block * interval
-                    if end == alloc_to_block:
-                        # collect left overs
-                        reward += total_reward - (reward_per_block * total_blocks)
-
-                    if reward > 0:
-                        distribution = Distribution(
-                            contract=pool_address,
-                            from_block=start,
-                            to_block=BlockNumber(start + interval),
-                            reward_token=allocation["reward_token"],
-                            reward=reward,
-                            uni_v3_token=EMPTY_ADDR_HEX,
-                        )
-                        distributions.append(distribution)
-                    break
-
-                if interval_reward > 0:
-                    distribution = Distribution(
+            if start >= end:
+                continue
+
+            # split the range into full intervals and the tail
+            tail_start = BlockNumber(end - (end - start) % BLOCKS_INTERVAL)
+            if interval_reward > 0:
+                distributions.extend(
+                    Distribution(
                         contract=pool_address,
-                        from_block=start,
-                        to_block=BlockNumber(start + BLOCKS_INTERVAL),
+                        from_block=BlockNumber(interval_start),
+                        to_block=BlockNumber(interval_start + BLOCKS_INTERVAL),
                         reward_token=allocation["reward_token"],
                         reward=interval_reward,
                         uni_v3_token=EMPTY_ADDR_HEX,
                     )
-                    distributions.append(distribution)
-                start += BLOCKS_INTERVAL
+                    for interval_start in range(start, tail_start, BLOCKS_INTERVAL)
+                )
+
+            if tail_start == end:
+                continue
+
+            reward = reward_per_block * (end - tail_start)
+            if end == alloc_to_block:
+                # collect left overs
+                reward += total_reward - (reward_per_block * total_blocks)
+
+            if reward > 0:
+                distribution = Distribution(
+                    contract=pool_address,
+                    from_block=tail_start,
+                    to_block=end,
+                    reward_token=allocation["reward_token"],
+                    reward=reward,
+                    uni_v3_token=EMPTY_ADDR_HEX,
+                )
+                distributions.append(distribution)
 
     return distributions
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def get_uniswap_v3_liquidity_points(
     network: str, pool_address: ChecksumAddress, block_number: BlockNumber
 ) -> Balances:
@@ -185,7 +186,7 @@ async def get_uniswap_v3_liquidity_points(
     balances: Dict[ChecksumAddress, int] = {}
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -193,14 +194,13 @@ async def get_uniswap_v3_liquidity_points(
         if liquidity <= 0:
             continue
 
-        balances[account] = balances.setdefault(account, 0) + liquidity
+        balances[account] = balances.get(account, 0) + liquidity
 
         total_supply += liquidity
 
     return Balances(total_supply=total_supply, balances=balances)
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def get_uniswap_v3_range_liquidity_points(
     network: str,
     tick_lower: int,
@@ -227,7 +227,7 @@ async def get_uniswap_v3_range_liquidity_points(
     balances: Dict[ChecksumAddress, int] = {}
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -235,14 +235,13 @@ async def get_uniswap_v3_range_liquidity_points(
         if liquidity <= 0:
             continue
 
-        balances[account] = balances.setdefault(account, 0) + liquidity
+        balances[account] = balances.get(account, 0) + liquidity
 
         total_supply += liquidity
 
     return Balances(total_supply=total_supply, balances=balances)
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def get_uniswap_v3_single_token_balances(
     network: str,
     pool_address: ChecksumAddress,
@@ -271,8 +270,8 @@ async def get_uniswap_v3_single_token_balances(
         return Balances(total_supply=0, balances={})
     sqrt_price = int(sqrt_price)
 
-    token0_address: ChecksumAddress = Web3.toChecksumAddress(pool["token0"])
-    token1_address: ChecksumAddress = Web3.toChecksumAddress(pool["token1"])
+    token0_address: ChecksumAddress = to_checksum_address(pool["token0"])
+    token1_address: ChecksumAddress = to_checksum_address(pool["token1"])
 
     positions: List = await execute_uniswap_v3_paginated_gql_query(
         network=network,
@@ -289,7 +288,7 @@ async def get_uniswap_v3_single_token_balances(
     balances: Dict[ChecksumAddress, int] = {}
     total_supply = 0
     for position in positions:
-        account = Web3.toChecksumAddress(position["owner"])
+        account = to_checksum_address(position["owner"])
         if account == EMPTY_ADDR_HEX:
             continue
 
@@ -311,7 +310,7 @@ async def get_uniswap_v3_single_token_balances(
                 tick_upper=tick_upper,
                 liquidity=liquidity,
             )
-            balances[account] = balances.setdefault(account, 0) + token0_amount
+            balances[account] = balances.get(account, 0) + token0_amount
             total_supply += token0_amount
         elif token1_address == token:
             token1_amount = _get_amount1(
@@ -322,7 +321,7 @@ async def get_uniswap_v3_single_token_balances(
                 liquidity=liquidity,
             )
 
-            balances[account] = balances.setdefault(account, 0) + token1_amount
+            balances[account] = balances.get(account, 0) + token1_amount
             total_supply += token1_amount
 
     return Balances(total_supply=total_supply, balances=balances)
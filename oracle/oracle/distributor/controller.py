@@ -1,13 +1,14 @@
 import asyncio
 import logging
+from typing import Dict, Tuple
 
 from eth_account.signers.local import LocalAccount
 from eth_typing import HexStr
 from web3 import Web3
 
+from oracle.oracle.common.ipfs import ipfs_fetch
 from oracle.oracle.distributor.common.distributor_tokens import (
-    get_distributor_redirects,
-    get_distributor_tokens,
+    get_distributor_tokens_and_redirects,
 )
 from oracle.oracle.distributor.common.eth1 import (
     get_disabled_stakers_reward_token_distributions,
@@ -71,16 +72,31 @@ class DistributorController(object):
             f"Voting for Merkle Distributor rewards: from block={from_block}, to block={to_block}"
         )
 
-        # fetch active periodic allocations
-        active_allocations = await get_periodic_allocations(
-            network=NETWORK, from_block=from_block, to_block=to_block
-        )
-        uniswap_v3_pools = await get_uniswap_v3_pools(
-            network=NETWORK,
-            block_number=to_block,
-            reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
-            staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
-            swise_token_address=NETWORK_CONFIG["SWISE_TOKEN_CONTRACT_ADDRESS"],
+        # fetch active periodic allocations, uni v3 pools and disabled stakers
+        # distributions concurrently as they don't depend on each other
+        (
+            active_allocations,
+            uniswap_v3_pools,
+            disabled_stakers_distributions,
+        ) = await asyncio.gather(
+            get_periodic_allocations(
+                network=NETWORK, from_block=from_block, to_block=to_block
+            ),
+            get_uniswap_v3_pools(
+                network=NETWORK,
+                block_number=to_block,
+                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
+                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
+                swise_token_address=NETWORK_CONFIG["SWISE_TOKEN_CONTRACT_ADDRESS"],
+            ),
+            get_disabled_stakers_reward_token_distributions(
+                network=NETWORK,
+                distributor_reward=voting_params["distributor_reward"],
+                from_block=from_block,
+                to_block=to_block,
+                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
+                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
+            ),
         )
 
         # fetch uni v3 distributions
@@ -90,18 +106,6 @@ class DistributorController(object):
             from_block=from_block,
             to_block=to_block,
         )
-
-        # fetch disabled stakers distributions
-        disabled_stakers_distributions = (
-            await get_disabled_stakers_reward_token_distributions(
-                network=NETWORK,
-                distributor_reward=voting_params["distributor_reward"],
-                from_block=from_block,
-                to_block=to_block,
-                reward_token_address=NETWORK_CONFIG["REWARD_TOKEN_CONTRACT_ADDRESS"],
-                staked_token_address=NETWORK_CONFIG["STAKED_TOKEN_CONTRACT_ADDRESS"],
-            )
-        )
         all_distributions.extend(disabled_stakers_distributions)
 
         last_merkle_root = voting_params["last_merkle_root"]
@@ -111,9 +115,13 @@ class DistributorController(object):
             and w3.toInt(hexstr=last_merkle_root)
             and last_merkle_proofs
         ):
-            # fetch accounts that have claimed since last merkle root update
-            claimed_accounts = await get_distributor_claimed_accounts(
-                network=NETWORK, merkle_root=last_merkle_root
+            # fetch accounts that have claimed since last merkle root update,
+            # previous merkle proofs are fetched meanwhile into the IPFS cache
+            claimed_accounts, _ = await asyncio.gather(
+                get_distributor_claimed_accounts(
+                    network=NETWORK, merkle_root=last_merkle_root
+                ),
+                ipfs_fetch(last_merkle_proofs),
             )
 
             # calculate unclaimed rewards
@@ -126,8 +134,11 @@ class DistributorController(object):
 
         # calculate reward distributions with coroutines
         tasks = []
-        distributor_tokens = await get_distributor_tokens(NETWORK, from_block)
-        distributor_redirects = await get_distributor_redirects(NETWORK, from_block)
+        balances_cache: Dict[Tuple, asyncio.Future] = {}
+        (
+            distributor_tokens,
+            distributor_redirects,
+        ) = await get_distributor_tokens_and_redirects(NETWORK, from_block)
         for dist in all_distributions:
             distributor_rewards = DistributorRewards(
                 uniswap_v3_pools=uniswap_v3_pools,
@@ -137,6 +148,7 @@ class DistributorController(object):
                 distributor_redirects=distributor_redirects,
                 reward_token=dist["reward_token"],
                 uni_v3_token=dist["uni_v3_token"],
+                balances_cache=balances_cache,
             )
             task = distributor_rewards.get_rewards(
                 contract_address=dist["contract"], reward=dist["reward"]
@@ -219,7 +231,7 @@ class DistributorController(object):
             merkle_root=merkle_root,
             merkle_proofs=claims_link,
         )
-        submit_vote(
+        await submit_vote(
             oracle=self.oracle,
             encoded_data=encoded_data,
             vote=vote,
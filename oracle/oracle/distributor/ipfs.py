@@ -1,10 +1,11 @@
+import asyncio
 import json
 import logging
 
 import backoff
 import ipfshttpclient
-from aiohttp import ClientSession
 
+from oracle.oracle.common.clients import get_http_session
 from oracle.oracle.common.ipfs import ipfs_fetch
 from oracle.oracle.distributor.common.types import ClaimedAccounts, Claims, Rewards
 from oracle.settings import (
@@ -34,21 +35,17 @@ async def get_unclaimed_balances(
         if "reward_tokens" in claim:
             for i, reward_token in enumerate(claim["reward_tokens"]):
                 for origin, value in zip(claim["origins"][i], claim["values"][i]):
-                    prev_unclaimed = unclaimed_rewards.setdefault(
-                        account, {}
-                    ).setdefault(reward_token, "0")
-                    unclaimed_rewards[account][reward_token] = str(
+                    account_rewards = unclaimed_rewards.setdefault(account, {})
+                    prev_unclaimed = account_rewards.get(reward_token, "0")
+                    account_rewards[reward_token] = str(
                         int(prev_unclaimed) + int(value)
                     )
         else:
             for i, token in enumerate(claim["tokens"]):
                 value = claim["values"][i]
-                prev_unclaimed = unclaimed_rewards.setdefault(account, {}).setdefault(
-                    token, "0"
-                )
-                unclaimed_rewards[account][token] = str(
-                    int(prev_unclaimed) + int(value)
-                )
+                account_rewards = unclaimed_rewards.setdefault(account, {})
+                prev_unclaimed = account_rewards.get(token, "0")
+                account_rewards[token] = str(int(prev_unclaimed) + int(value))
 
     return unclaimed_rewards
 
@@ -63,51 +60,59 @@ def add_ipfs_prefix(ipfs_id: str) -> str:
     return ipfs_id
 
 
+def _client_upload(endpoint: str, claims: Claims, **kwargs) -> str:
+    """Adds claims to the IPFS node and pins the file."""
+    with ipfshttpclient.connect(endpoint, **kwargs) as client:
+        ipfs_id = client.add_json(claims)
+        client.pin.add(ipfs_id)
+    return ipfs_id
+
+
+async def _pinata_upload(claims: Claims) -> str:
+    """Pins claims to the Pinata."""
+    headers = {
+        "pinata_api_key": IPFS_PINATA_API_KEY,
+        "pinata_secret_api_key": IPFS_PINATA_SECRET_KEY,
+        "Content-Type": "application/json",
+    }
+    async with get_http_session().post(
+        url=IPFS_PINATA_PIN_ENDPOINT,
+        data=json.dumps({"pinataContent": claims}, sort_keys=True),
+        headers=headers,
+    ) as response:
+        response.raise_for_status()
+        return (await response.json())["IpfsHash"]
+
+
 @backoff.on_exception(backoff.expo, Exception, max_time=900)
 async def upload_claims(claims: Claims) -> str:
     """Submits claims to the IPFS and pins the file."""
     # TODO: split claims into files up to 1000 entries
-    ipfs_ids = []
-    try:
-        with ipfshttpclient.connect(
+    # IPFS HTTP client is blocking, run its uploads in threads
+    uploads = [
+        asyncio.to_thread(
+            _client_upload,
             INFURA_IPFS_CLIENT_ENDPOINT,
+            claims,
             username=INFURA_IPFS_CLIENT_USERNAME,
             password=INFURA_IPFS_CLIENT_PASSWORD,
             timeout=180,
-        ) as client:
-            ipfs_id = client.add_json(claims)
-            client.pin.add(ipfs_id)
-            ipfs_ids.append(ipfs_id)
-    except Exception as e:
-        logger.error(e)
-
+        )
+    ]
     if LOCAL_IPFS_CLIENT_ENDPOINT:
-        try:
-            with ipfshttpclient.connect(LOCAL_IPFS_CLIENT_ENDPOINT) as client:
-                ipfs_id = client.add_json(claims)
-                client.pin.add(ipfs_id)
-                ipfs_ids.append(ipfs_id)
-        except Exception as e:
-            logger.error(e)
+        uploads.append(
+            asyncio.to_thread(_client_upload, LOCAL_IPFS_CLIENT_ENDPOINT, claims)
+        )
 
     if IPFS_PINATA_API_KEY and IPFS_PINATA_SECRET_KEY:
-        headers = {
-            "pinata_api_key": IPFS_PINATA_API_KEY,
-            "pinata_secret_api_key": IPFS_PINATA_SECRET_KEY,
-            "Content-Type": "application/json",
-        }
-        try:
-            async with ClientSession(headers=headers) as session:
-                response = await session.post(
-                    url=IPFS_PINATA_PIN_ENDPOINT,
-                    data=json.dumps({"pinataContent": claims}, sort_keys=True),
-                )
-                response.raise_for_status()
-                response = await response.json()
-                ipfs_id = response["IpfsHash"]
-                ipfs_ids.append(ipfs_id)
-        except Exception as e:  # noqa: E722
-            logger.error(e)
+        uploads.append(_pinata_upload(claims))
+
+    ipfs_ids = []
+    for result in await asyncio.gather(*uploads, return_exceptions=True):
+        if isinstance(result, BaseException):
+            logger.error(result)
+        else:
+            ipfs_ids.append(result)
 
     if not ipfs_ids:
         raise RuntimeError("Failed to submit claims to IPFS")
@@ -1,6 +1,6 @@
-import copy
+import asyncio
 import logging
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import BlockNumber, ChecksumAddress
@@ -29,6 +29,7 @@ class DistributorRewards(object):
         distributor_redirects: Dict[ChecksumAddress, ChecksumAddress],
         reward_token: ChecksumAddress,
         uni_v3_token: ChecksumAddress,
+        balances_cache: Dict[Tuple, asyncio.Future],
     ) -> None:
         self.distributor_tokens = distributor_tokens
         self.distributor_fallback_address = NETWORK_CONFIG[
@@ -47,20 +48,22 @@ class DistributorRewards(object):
         self.uni_v3_staked_token_pools = uniswap_v3_pools["staked_token_pools"]
         self.uni_v3_reward_token_pools = uniswap_v3_pools["reward_token_pools"]
         self.uni_v3_swise_pools = uniswap_v3_pools["swise_pools"]
-        self.uni_v3_pools = self.uni_v3_swise_pools.union(
-            self.uni_v3_staked_token_pools
-        ).union(self.uni_v3_reward_token_pools)
+        self.uni_v3_pools = (
+            self.uni_v3_swise_pools
+            | self.uni_v3_staked_token_pools
+            | self.uni_v3_reward_token_pools
+        )
+        self.supported_contracts = frozenset(self.uni_v3_pools | distributor_tokens)
         self.from_block = from_block
         self.to_block = to_block
         self.uni_v3_token = uni_v3_token
         self.reward_token = reward_token
+        # balances fetches shared between the distributions of the same vote
+        self.balances_cache = balances_cache
 
     def is_supported_contract(self, contract_address: ChecksumAddress) -> bool:
         """Checks whether the provided contract address is supported."""
-        return (
-            contract_address in self.uni_v3_pools
-            or contract_address in self.distributor_tokens
-        )
+        return contract_address in self.supported_contracts
 
     @staticmethod
     def add_value(
@@ -70,23 +73,22 @@ class DistributorRewards(object):
         amount: int,
     ) -> None:
         """Adds reward token to the beneficiary address."""
-        prev_amount = rewards.setdefault(to, {}).setdefault(reward_token, "0")
-        rewards[to][reward_token] = str(int(prev_amount) + amount)
+        account_rewards = rewards.setdefault(to, {})
+        prev_amount = account_rewards.get(reward_token, "0")
+        account_rewards[reward_token] = str(int(prev_amount) + amount)
 
     @staticmethod
     def merge_rewards(rewards1: Rewards, rewards2: Rewards) -> Rewards:
-        """Merges two dictionaries into one."""
-        merged_rewards: Rewards = copy.deepcopy(rewards1)
+        """Merges the second dictionary into the first one and returns it."""
         for account, account_rewards in rewards2.items():
+            merged_account_rewards = rewards1.setdefault(account, {})
             for reward_token, value in account_rewards.items():
-                DistributorRewards.add_value(
-                    rewards=merged_rewards,
-                    to=account,
-                    reward_token=reward_token,
-                    amount=int(value),
+                prev_amount = merged_account_rewards.get(reward_token, "0")
+                merged_account_rewards[reward_token] = str(
+                    int(prev_amount) + int(value)
                 )
 
-        return merged_rewards
+        return rewards1
 
     async def get_rewards(
         self, contract_address: ChecksumAddress, reward: int
@@ -103,25 +105,35 @@ class DistributorRewards(object):
 
         if self.is_supported_contract(contract_address):
             visited.add(contract_address)
-            return await self._get_rewards(
+            account_rewards = await self._get_rewards(
                 contract_address=contract_address,
                 total_reward=reward,
                 visited=visited,
             )
+            return {
+                account: {self.reward_token: str(amount)}
+                for account, amount in account_rewards.items()
+            }
 
         # unknown allocation -> assign to the fallback address
-        rewards: Rewards = {}
-        self.add_value(
-            rewards=rewards,
-            to=self.distributor_fallback_address,
-            reward_token=self.reward_token,
-            amount=reward,
-        )
-
-        return rewards
+        return {self.distributor_fallback_address: {self.reward_token: str(reward)}}
 
     async def get_balances(self, contract_address: ChecksumAddress) -> Balances:
-        """Fetches balances and total supply of the contract."""
+        """Fetches balances and total supply of the contract once per blocks range."""
+        key = (contract_address, self.uni_v3_token, self.from_block, self.to_block)
+        task = self.balances_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_balances(contract_address))
+            self.balances_cache[key] = task
+
+        try:
+            # shield the shared fetch from the cancellation of a single caller
+            return await asyncio.shield(task)
+        except Exception:
+            self.balances_cache.pop(key, None)
+            raise
+
+    async def _fetch_balances(self, contract_address: ChecksumAddress) -> Balances:
         if (
             self.uni_v3_token == self.staked_token_contract_address
             and contract_address in self.uni_v3_staked_token_pools
@@ -202,27 +214,24 @@ class DistributorRewards(object):
         contract_address: ChecksumAddress,
         total_reward: int,
         visited: Set[ChecksumAddress],
-    ) -> Rewards:
-        rewards: Rewards = {}
+    ) -> Dict[ChecksumAddress, int]:
+        """Calculates reward token amounts of the contract accounts."""
+        rewards: Dict[ChecksumAddress, int] = {}
 
         # fetch user balances and total supply for reward portions calculation
         result = await self.get_balances(contract_address)
         total_supply = result["total_supply"]
         if total_supply <= 0:
             # no recipients for the rewards -> assign reward to the fallback address
-            self.add_value(
-                rewards=rewards,
-                to=self.distributor_fallback_address,
-                reward_token=self.reward_token,
-                amount=total_reward,
-            )
+            rewards[self.distributor_fallback_address] = total_reward
             return rewards
 
         balances = result["balances"]
 
         # distribute rewards to the users or recurse for the supported contracts
         total_distributed = 0
-        accounts: List[ChecksumAddress] = sorted(balances.keys())
+        sub_rewards = []
+        accounts: List[ChecksumAddress] = sorted(balances)
         last_account_index = len(accounts) - 1
         for i, account in enumerate(accounts):
             if i == last_account_index:
@@ -236,33 +245,31 @@ class DistributorRewards(object):
 
             # apply redirect of rewards
             if account in self.distributor_redirects:
-                visited = visited.union({account})
+                visited = visited | {account}
                 account = self.distributor_redirects[account]
 
             if account == contract_address or account in visited:
                 # failed to assign reward -> return it to fallback address
-                self.add_value(
-                    rewards=rewards,
-                    to=self.distributor_fallback_address,
-                    reward_token=self.reward_token,
-                    amount=account_reward,
+                rewards[self.distributor_fallback_address] = (
+                    rewards.get(self.distributor_fallback_address, 0) + account_reward
                 )
             elif self.is_supported_contract(account):
                 # recurse into the supported contract
-                new_rewards = await self._get_rewards(
-                    contract_address=account,
-                    total_reward=account_reward,
-                    visited=visited.union({account}),
+                sub_rewards.append(
+                    self._get_rewards(
+                        contract_address=account,
+                        total_reward=account_reward,
+                        visited=visited | {account},
+                    )
                 )
-                rewards = self.merge_rewards(rewards, new_rewards)
             else:
-                self.add_value(
-                    rewards=rewards,
-                    to=account,
-                    reward_token=self.reward_token,
-                    amount=account_reward,
-                )
+                rewards[account] = rewards.get(account, 0) + account_reward
 
             total_distributed += account_reward
 
+        # fetch the supported contracts concurrently
+        for new_rewards in await asyncio.gather(*sub_rewards):
+            for new_account, amount in new_rewards.items():
+                rewards[new_account] = rewards.get(new_account, 0) + amount
+
         return rewards
@@ -0,0 +1,63 @@
+import pytest
+from web3 import Web3
+
+from oracle.oracle.tests.factories import faker
+
+from ..common.merkle_tree import get_merkle_node
+
+w3 = Web3()
+
+
+@pytest.mark.parametrize("tokens_count", [0, 1, 3])
+def test_get_merkle_node(tokens_count):
+    index = faker.random_int(0, 10000)
+    account = faker.eth_address()
+    tokens = sorted(faker.eth_address() for _ in range(tokens_count))
+    values = [faker.wei_amount() for _ in range(tokens_count)]
+
+    expected = w3.keccak(
+        primitive=w3.codec.encode_abi(
+            ["uint256", "address[]", "address", "uint256[]"],
+            [index, tokens, account, values],
+        )
+    )
+    assert (
+        get_merkle_node(index=index, tokens=tokens, account=account, values=values)
+        == expected
+    )
+
+
+def test_get_merkle_node_lowercase_address():
+    account = faker.eth_address().lower()
+    tokens = [faker.eth_address().lower()]
+    values = [faker.wei_amount()]
+
+    expected = w3.keccak(
+        primitive=w3.codec.encode_abi(
+            ["uint256", "address[]", "address", "uint256[]"],
+            [0, tokens, account, values],
+        )
+    )
+    assert (
+        get_merkle_node(index=0, tokens=tokens, account=account, values=values)
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "account",
+    [
+        "0x1234",
+        "0x" + "ab" * 21,
+        "0x" + "Ab" * 20,
+        "not an address",
+    ],
+)
+def test_get_merkle_node_invalid_address(account):
+    with pytest.raises(ValueError):
+        get_merkle_node(
+            index=0,
+            tokens=[faker.eth_address()],
+            account=account,
+            values=[faker.wei_amount()],
+        )
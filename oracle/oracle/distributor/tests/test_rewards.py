@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+from ens.constants import EMPTY_ADDR_HEX
+
+from oracle.settings import NETWORK_CONFIG
+
+from ..common.types import Balances, UniswapV3Pools
+from ..rewards import DistributorRewards
+
+# digits only addresses are valid checksum addresses sorted in the listed order
+account = "0x" + "1" * 40
+pool = "0x" + "2" * 40
+redirected_account = "0x" + "3" * 40
+token = "0x" + "4" * 40
+last_account = "0x" + "5" * 40
+redirect_account = "0x" + "6" * 40
+pool_account = "0x" + "7" * 40
+reward_token = "0x" + "8" * 40
+fallback_address = NETWORK_CONFIG["DISTRIBUTOR_FALLBACK_ADDRESS"]
+
+BALANCES = {
+    token: Balances(
+        total_supply=10,
+        balances={
+            account: 3,
+            # nested supported contract
+            pool: 3,
+            redirected_account: 2,
+            # self reference
+            token: 1,
+            last_account: 1,
+        },
+    ),
+    pool: Balances(
+        total_supply=3,
+        # visited contract
+        balances={token: 1, pool_account: 2},
+    ),
+}
+
+
+async def get_balances(self, contract_address):
+    return BALANCES[contract_address]
+
+
+async def test_get_rewards():
+    distributor_rewards = DistributorRewards(
+        uniswap_v3_pools=UniswapV3Pools(
+            staked_token_pools=set(), reward_token_pools=set(), swise_pools={pool}
+        ),
+        from_block=1,
+        to_block=2,
+        distributor_tokens={token},
+        distributor_redirects={redirected_account: redirect_account},
+        reward_token=reward_token,
+        uni_v3_token=EMPTY_ADDR_HEX,
+        balances_cache={},
+    )
+    with patch.object(DistributorRewards, "get_balances", get_balances):
+        rewards = await distributor_rewards.get_rewards(
+            contract_address=token, reward=1001
+        )
+
+    assert rewards == {
+        account: {reward_token: "300"},
+        pool_account: {reward_token: "200"},
+        redirect_account: {reward_token: "200"},
+        # the remainder goes to the last account
+        last_account: {reward_token: "101"},
+        fallback_address: {reward_token: "200"},
+    }
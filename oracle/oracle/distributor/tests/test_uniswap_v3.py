@@ -0,0 +1,57 @@
+import pytest
+from ens.constants import EMPTY_ADDR_HEX
+
+from oracle.oracle.tests.factories import faker
+
+from ..common.types import TokenAllocation, UniswapV3Pools
+from ..common.uniswap_v3 import get_uniswap_v3_distributions
+
+pool = faker.eth_address()
+reward_token = faker.eth_address()
+
+
+def get_distribution(from_block, to_block, reward):
+    return dict(
+        contract=pool,
+        from_block=from_block,
+        to_block=to_block,
+        reward_token=reward_token,
+        reward=reward,
+        uni_v3_token=EMPTY_ADDR_HEX,
+    )
+
+
+@pytest.mark.parametrize(
+    "alloc_to_block,reward,to_block,expected",
+    [
+        # exact multiple of the interval, left overs are collected with the tail only
+        (554, 5541, 554, [(0, 277, 2770), (277, 554, 2770)]),
+        # tail at the allocation end collects left overs
+        (600, 6005, 600, [(0, 277, 2770), (277, 554, 2770), (554, 600, 465)]),
+        # tail before the allocation end
+        (1000, 10003, 600, [(0, 277, 2770), (277, 554, 2770), (554, 600, 460)]),
+        # zero interval reward
+        (1000, 500, 1000, [(831, 1000, 500)]),
+    ],
+)
+async def test_get_uniswap_v3_distributions(alloc_to_block, reward, to_block, expected):
+    pools = UniswapV3Pools(
+        staked_token_pools=set(), reward_token_pools=set(), swise_pools={pool}
+    )
+    allocations = {
+        pool: [
+            TokenAllocation(
+                from_block=0,
+                to_block=alloc_to_block,
+                reward_token=reward_token,
+                reward=reward,
+            )
+        ]
+    }
+    distributions = await get_uniswap_v3_distributions(
+        pools=pools,
+        active_allocations=allocations,
+        from_block=0,
+        to_block=to_block,
+    )
+    assert distributions == [get_distribution(*args) for args in expected]
@@ -3,11 +3,11 @@ import logging
 import threading
 from urllib.parse import urlparse
 
-import aiohttp
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 
 from oracle.health_server import create_health_server_runner, start_health_server
+from oracle.oracle.common.clients import close_sessions, get_http_session
 from oracle.oracle.common.eth1 import (
     get_finalized_block,
     get_latest_block_number,
@@ -47,7 +47,7 @@ logger = logging.getLogger(__name__)
 async def main() -> None:
     oracle_account: LocalAccount = await get_oracle_account()
     # aiohttp session
-    session = aiohttp.ClientSession()
+    session = get_http_session()
     await init_checks(oracle_account, session)
 
     # wait for interrupt
@@ -70,14 +70,14 @@ async def main() -> None:
         distributor_controller,
         validators_controller,
     )
-    await session.close()
+    await close_sessions()
 
 
 async def init_checks(oracle_account, session):
     # try submitting test vote
     logger.info(f"Submitting test vote for account {oracle_account.address}...")
     # noinspection PyTypeChecker
-    submit_vote(
+    await submit_vote(
         oracle=oracle_account,
         encoded_data=b"test data",
         vote={"name": "test vote"},
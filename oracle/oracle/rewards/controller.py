@@ -18,6 +18,7 @@ from oracle.settings import (
     NETWORK,
     NETWORK_CONFIG,
     REWARD_VOTE_FILENAME,
+    VALIDATORS_FETCH_CONCURRENCY,
     WAD,
 )
 
@@ -32,6 +33,8 @@ from .eth2 import (
 logger = logging.getLogger(__name__)
 w3 = Web3()
 
+GWEI = Web3.toWei(1, "gwei")
+
 
 class RewardsController(object):
     """Updates total rewards and activated validators number."""
@@ -53,6 +56,8 @@ class RewardsController(object):
         )
         self.deposit_token_symbol = NETWORK_CONFIG["DEPOSIT_TOKEN_SYMBOL"]
         self.last_vote_total_rewards = None
+        self.last_vote = None
+        self.finalized_epoch = 0
 
     @save
     async def process(
@@ -75,9 +80,6 @@ class RewardsController(object):
         if next_update_time > current_time:
             return
 
-        # fetch pool validator BLS public keys
-        public_keys = await get_registered_validators_public_keys(current_block_number)
-
         # calculate current ETH2 epoch
         update_timestamp = int(
             next_update_time.replace(tzinfo=timezone.utc).timestamp()
@@ -86,41 +88,57 @@ class RewardsController(object):
             update_timestamp - self.genesis_timestamp
         ) // self.seconds_per_epoch
 
+        # fetch pool validator BLS public keys
+        public_keys = await get_registered_validators_public_keys(current_block_number)
+
         logger.info(
             f"Voting for new total rewards with parameters:"
             f" timestamp={update_timestamp}, epoch={update_epoch}"
         )
 
-        # wait for the epoch to get finalized
-        checkpoints = await get_finality_checkpoints(self.aiohttp_session)
-        while update_epoch > int(checkpoints["finalized"]["epoch"]):
-            logger.info(f"Waiting for the epoch {update_epoch} to finalize...")
-            await asyncio.sleep(360)
+        # wait for the epoch to get finalized, finalized epoch never decreases
+        while update_epoch > self.finalized_epoch:
             checkpoints = await get_finality_checkpoints(self.aiohttp_session)
+            self.finalized_epoch = int(checkpoints["finalized"]["epoch"])
+            if update_epoch > self.finalized_epoch:
+                logger.info(f"Waiting for the epoch {update_epoch} to finalize...")
+                await asyncio.sleep(360)
 
         state_id = str(update_epoch * self.slots_per_epoch)
         total_rewards: Wei = voting_params["total_fees"]
         activated_validators = 0
         chunk_size = NETWORK_CONFIG["VALIDATORS_FETCH_CHUNK_SIZE"]
+        apply_mgno_rate = NETWORK == GNOSIS_CHAIN
 
-        # fetch balances in chunks
-        for i in range(0, len(public_keys), chunk_size):
-            validators = await get_validators(
-                session=self.aiohttp_session,
-                public_keys=public_keys[i : i + chunk_size],
-                state_id=state_id,
-            )
+        # fetch balances in chunks concurrently
+        semaphore = asyncio.Semaphore(VALIDATORS_FETCH_CONCURRENCY)
+
+        async def fetch_chunk(chunk_public_keys):
+            async with semaphore:
+                return await get_validators(
+                    session=self.aiohttp_session,
+                    public_keys=chunk_public_keys,
+                    state_id=state_id,
+                )
+
+        chunks = await asyncio.gather(
+            *[
+                fetch_chunk(public_keys[i : i + chunk_size])
+                for i in range(0, len(public_keys), chunk_size)
+            ]
+        )
+        for validators in chunks:
             for validator in validators:
                 if ValidatorStatus(validator["status"]) in PENDING_STATUSES:
                     continue
 
                 activated_validators += 1
                 validator_reward = (
-                    Web3.toWei(validator["balance"], "gwei") - self.deposit_amount
+                    int(validator["balance"]) * GWEI - self.deposit_amount
                 )
-                if NETWORK == GNOSIS_CHAIN:
+                if apply_mgno_rate:
                     # apply mGNO <-> GNO exchange rate
-                    validator_reward = Wei(int(validator_reward * WAD // MGNO_RATE))
+                    validator_reward = validator_reward * WAD // MGNO_RATE
                 total_rewards += validator_reward
 
         pretty_total_rewards = self.format_ether(total_rewards)
@@ -143,6 +161,13 @@ class RewardsController(object):
             total_rewards = voting_params["total_rewards"]
             pretty_total_rewards = self.format_ether(total_rewards)
 
+        # skip redundant vote upload, the public keys and balances are still
+        # fetched every interval as the vote inputs can change between them
+        current_nonce = voting_params["rewards_nonce"]
+        vote_payload = (current_nonce, activated_validators, total_rewards)
+        if self.last_vote == vote_payload:
+            return
+
         # submit vote
         logger.info(
             f"Submitting rewards vote:"
@@ -151,7 +176,6 @@ class RewardsController(object):
             f" activated validators={activated_validators}"
         )
 
-        current_nonce = voting_params["rewards_nonce"]
         encoded_data: bytes = w3.codec.encode_abi(
             ["uint256", "uint256", "uint256"],
             [current_nonce, activated_validators, total_rewards],
@@ -162,7 +186,7 @@ class RewardsController(object):
             activated_validators=activated_validators,
             total_rewards=str(total_rewards),
         )
-        submit_vote(
+        await submit_vote(
             oracle=self.oracle,
             encoded_data=encoded_data,
             vote=vote,
@@ -171,6 +195,7 @@ class RewardsController(object):
         logger.info("Rewards vote has been successfully submitted")
 
         self.last_vote_total_rewards = total_rewards
+        self.last_vote = vote_payload
 
     def format_ether(self, value: Union[str, int, Wei]) -> str:
         """Converts Wei value."""
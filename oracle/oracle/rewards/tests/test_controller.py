@@ -120,3 +120,52 @@ class TestRewardController:
             )
             vote_mock.assert_called_once_with(**vote)
             await session.close()
+
+    async def test_process_total_fees_changed(self):
+        validators = get_validators()
+        with patch(
+            "oracle.oracle.rewards.eth1.execute_sw_gql_paginated_query",
+            return_value=get_registered_validators_public_keys(),
+        ), patch(
+            "oracle.oracle.rewards.controller.get_finality_checkpoints",
+            side_effect=get_finality_checkpoints,
+        ), patch(
+            "oracle.oracle.rewards.controller.get_validators",
+            return_value=validators,
+        ), patch(
+            "oracle.oracle.rewards.controller.submit_vote", return_value=None
+        ) as vote_mock:
+            session = aiohttp.ClientSession()
+            rewards_nonce = faker.random_int(1000, 2000)
+            validators_rewards = sum(
+                int(validator["balance"]) * 10**9 - w3.toWei(32, "ether")
+                for validator in validators[:2]
+            )
+
+            controller = RewardsController(
+                aiohttp_session=session,
+                genesis_timestamp=1606824023,
+                oracle=get_test_oracle(),
+            )
+            total_fees = faker.wei_amount()
+            for fees in [total_fees, total_fees, total_fees + 1]:
+                await controller.process(
+                    voting_params=RewardsVotingParameters(
+                        rewards_nonce=rewards_nonce,
+                        total_rewards=0,
+                        total_fees=fees,
+                        rewards_updated_at_timestamp=Timestamp(1649854536),
+                    ),
+                    current_block_number=BlockNumber(14583706),
+                    current_timestamp=Timestamp(1649941516),
+                )
+
+            # unchanged vote is not submitted again, changed fees are re-voted
+            assert vote_mock.call_count == 2
+            for call, fees in zip(
+                vote_mock.call_args_list, [total_fees, total_fees + 1]
+            ):
+                assert call.kwargs["vote"]["total_rewards"] == str(
+                    fees + validators_rewards
+                )
+            await session.close()
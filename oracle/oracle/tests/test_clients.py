@@ -1,16 +1,21 @@
+import asyncio
 import itertools
 from typing import Dict, List
 from unittest.mock import patch
 
-from gql import gql
+import pytest
+from gql import Client, gql
 
 from oracle.oracle.common.clients import (
+    GraphqlConsensusError,
+    close_sessions,
     execute_ethereum_gql_query,
     execute_ethereum_paginated_gql_query,
     execute_sw_gql_paginated_query,
     execute_sw_gql_query,
     execute_uniswap_v3_gql_query,
     execute_uniswap_v3_paginated_gql_query,
+    get_gql_session,
 )
 
 from .common import TEST_NETWORK
@@ -84,7 +89,7 @@ class TestClients:
 
         paginated_data = [
             {"results": [{"id": x} for x in range(1000)]},
-            {"results": [{"id": x} for x in range(1000)]},
+            {"results": [{"id": x} for x in range(1000, 2000)]},
             {"results": [{"id": x} for x in range(1)]},
         ]
         result = await _execute_query(paginated_data)
@@ -92,6 +97,15 @@ class TestClients:
             itertools.chain.from_iterable([x["results"] for x in paginated_data])
         )
 
+        # stalled pagination fails instead of returning a partial result
+        paginated_data = [
+            {"results": [{"id": x} for x in range(1000)]},
+            {"results": [{"id": x} for x in range(1000)]},
+            {"results": [{"id": x} for x in range(1000)]},
+        ]
+        with pytest.raises(GraphqlConsensusError):
+            await _execute_query(paginated_data)
+
     async def test_basic(self):
         for query_func in [
             execute_ethereum_gql_query,
@@ -106,3 +120,32 @@ class TestClients:
             execute_uniswap_v3_paginated_gql_query,
         ]:
             await self._test_paginated(query_func)
+
+    async def test_session_reuse(self):
+        url = "https://example.com/subgraphs/name/test"
+        session = await get_gql_session(url)
+        assert await get_gql_session(url) is session
+        assert await get_gql_session(url + "-other") is not session
+        await close_sessions()
+        assert await get_gql_session(url) is not session
+        await close_sessions()
+
+    async def test_session_concurrent_connect(self):
+        url = "https://example.com/subgraphs/name/test"
+        connect_async = Client.connect_async
+
+        async def _connect_async(client, *args, **kwargs):
+            # let the other caller run while connecting
+            await asyncio.sleep(0)
+            return await connect_async(client, *args, **kwargs)
+
+        with patch.object(
+            Client, "connect_async", autospec=True, side_effect=_connect_async
+        ) as connect_mock:
+            session1, session2 = await asyncio.gather(
+                get_gql_session(url), get_gql_session(url)
+            )
+
+        assert session1 is session2
+        assert connect_mock.call_count == 1
+        await close_sessions()
@@ -1,7 +1,10 @@
 import asyncio
 import logging
 from collections import OrderedDict
-from functools import wraps
+from functools import lru_cache, wraps
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,12 @@ def save(func):
     return wrapper
 
 
+@lru_cache(maxsize=65536)
+def to_checksum_address(address: str) -> ChecksumAddress:
+    """Converts address to the checksum format, caching the recurring ones."""
+    return Web3.toChecksumAddress(address)
+
+
 class LimitedSizeDict(OrderedDict):
     def __init__(self, *args, **kwds):
         self.size_limit = kwds.pop("size_limit", None)
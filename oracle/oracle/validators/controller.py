@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Set
 
@@ -55,26 +56,15 @@ class ValidatorsController:
             # not enough balance to register next validator
             return
 
-        validators_deposit_data: List[ValidatorDepositData] = []
-        used_pubkeys: Set[HexStr] = set()
-        for _ in range(validators_count):
-            # select next validator
-            # TODO: implement scoring system based on the operators performance
-            deposit_data = await select_validator(
-                block_number=block_number,
-                used_pubkeys=used_pubkeys,
-            )
-            if deposit_data is None:
-                break
-
-            used_pubkeys.add(deposit_data["public_key"])
-            validators_deposit_data.append(deposit_data)
-
+        # fetch validators deposit root while selecting the validators
+        validators_deposit_data, validators_deposit_root = await asyncio.gather(
+            self.select_validators(block_number, validators_count),
+            get_validators_deposit_root(block_number),
+        )
         if not validators_deposit_data:
             logger.warning("Run out of validator keys")
             return
 
-        validators_deposit_root = await get_validators_deposit_root(block_number)
         if (
             self.last_vote_validators_deposit_root == validators_deposit_root
             and self.last_validators_deposit_data == validators_deposit_data
@@ -112,7 +102,7 @@ class ValidatorsController:
             deposit_data=validators_deposit_data,
         )
 
-        submit_vote(
+        await submit_vote(
             oracle=self.oracle,
             encoded_data=encoded_data,
             vote=vote,
@@ -123,3 +113,24 @@ class ValidatorsController:
         # skip voting for the same validator and validators deposit root in the next check
         self.last_validators_deposit_data = validators_deposit_data
         self.last_vote_validators_deposit_root = validators_deposit_root
+
+    async def select_validators(
+        self, block_number: BlockNumber, validators_count: int
+    ) -> List[ValidatorDepositData]:
+        """Selects up to validators count of the next validators to register."""
+        validators_deposit_data: List[ValidatorDepositData] = []
+        used_pubkeys: Set[HexStr] = set()
+        for _ in range(validators_count):
+            # select next validator
+            # TODO: implement scoring system based on the operators performance
+            deposit_data = await select_validator(
+                block_number=block_number,
+                used_pubkeys=used_pubkeys,
+            )
+            if deposit_data is None:
+                break
+
+            used_pubkeys.add(deposit_data["public_key"])
+            validators_deposit_data.append(deposit_data)
+
+        return validators_deposit_data
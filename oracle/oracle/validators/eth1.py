@@ -1,8 +1,8 @@
-from typing import Dict, Set, Union
+import asyncio
+from typing import Dict, List, Set, Union
 
 from ens.constants import EMPTY_ADDR_HEX
 from eth_typing import HexStr
-from web3 import Web3
 from web3.types import BlockNumber
 
 from oracle.oracle.common.clients import (
@@ -16,28 +16,36 @@ from oracle.oracle.common.graphql_queries import (
     VALIDATOR_REGISTRATIONS_QUERY,
 )
 from oracle.oracle.common.ipfs import ipfs_fetch
+from oracle.oracle.utils import LimitedSizeDict, to_checksum_address
 from oracle.settings import NETWORK, NETWORK_CONFIG
 
 from .types import ValidatorDepositData
 
+# number of deposit data public keys checked for registration with a single query
+REGISTRATIONS_CHECK_BATCH_SIZE = 100
+
+# validators deposit root at the block does not change
+VALIDATORS_DEPOSIT_ROOT_CACHE = LimitedSizeDict(size_limit=8)
+
 
 async def select_validator(
     block_number: BlockNumber, used_pubkeys: Set[HexStr]
 ) -> Union[None, ValidatorDepositData]:
     """Selects the next validator to register."""
-    result: Dict = await execute_sw_gql_query(
-        network=NETWORK,
-        query=OPERATORS_QUERY,
-        variables=dict(block_number=block_number),
+    operators_result, last_validators_result = await asyncio.gather(
+        execute_sw_gql_query(
+            network=NETWORK,
+            query=OPERATORS_QUERY,
+            variables=dict(block_number=block_number),
+        ),
+        execute_sw_gql_query(
+            network=NETWORK,
+            query=LAST_VALIDATORS_QUERY,
+            variables=dict(block_number=block_number),
+        ),
     )
-    operators = result["operators"]
-    result: Dict = await execute_sw_gql_query(
-        network=NETWORK,
-        query=LAST_VALIDATORS_QUERY,
-        variables=dict(block_number=block_number),
-    )
-
-    last_validators = result["validators"]
+    operators = operators_result["operators"]
+    last_validators = last_validators_result["validators"]
     if last_validators:
         last_operator_id = last_validators[0]["operator"]["id"]
         index = _find_operator_index(operators, last_operator_id)
@@ -45,68 +53,107 @@ async def select_validator(
             operators = operators[index + 1 :] + [operators[index]] + operators[:index]
 
     _move_to_bottom(operators, NETWORK_CONFIG["ORACLE_STAKEWISE_OPERATOR"])
+    operators = [
+        operator for operator in operators if operator["depositDataMerkleProofs"]
+    ]
+
+    # fetch deposit data of all the operators at once, check them in the priority order
+    deposit_datum_tasks = [
+        asyncio.create_task(ipfs_fetch(operator["depositDataMerkleProofs"]))
+        for operator in operators
+    ]
+    try:
+        for operator, deposit_datum_task in zip(operators, deposit_datum_tasks):
+            operator_address = to_checksum_address(operator["id"])
+            deposit_data_index = int(operator["depositDataIndex"])
+            deposit_datum = await deposit_datum_task
+
+            max_deposit_data_index = len(deposit_datum) - 1
+            if deposit_data_index > max_deposit_data_index:
+                continue
 
-    for operator in operators:
-        merkle_proofs = operator["depositDataMerkleProofs"]
-        if not merkle_proofs:
-            continue
+            # the edge case when the validator was registered in previous merkle root
+            # and the deposit data is presented in the same.
+            selected_deposit_data = await _find_unregistered_deposit_data(
+                block_number=block_number,
+                deposit_datum=deposit_datum[deposit_data_index:],
+                used_pubkeys=used_pubkeys,
+            )
+            if selected_deposit_data is not None:
+                return ValidatorDepositData(
+                    operator=operator_address,
+                    public_key=selected_deposit_data["public_key"],
+                    withdrawal_credentials=selected_deposit_data[
+                        "withdrawal_credentials"
+                    ],
+                    deposit_data_root=selected_deposit_data["deposit_data_root"],
+                    deposit_data_signature=selected_deposit_data["signature"],
+                    proof=selected_deposit_data["proof"],
+                )
+    finally:
+        for deposit_datum_task in deposit_datum_tasks:
+            deposit_datum_task.cancel()
+
+        # retrieve exceptions of the already failed fetches to not leave them unhandled
+        await asyncio.gather(*deposit_datum_tasks, return_exceptions=True)
+
+    return None
 
-        operator_address = Web3.toChecksumAddress(operator["id"])
-        deposit_data_index = int(operator["depositDataIndex"])
-        deposit_datum = await ipfs_fetch(merkle_proofs)
 
-        max_deposit_data_index = len(deposit_datum) - 1
-        if deposit_data_index > max_deposit_data_index:
+async def _find_unregistered_deposit_data(
+    block_number: BlockNumber, deposit_datum: List[Dict], used_pubkeys: Set[HexStr]
+) -> Union[None, Dict]:
+    """Returns the first deposit data which public key is not used or registered."""
+    used_pubkeys = set(public_key.lower() for public_key in used_pubkeys)
+    for i in range(0, len(deposit_datum), REGISTRATIONS_CHECK_BATCH_SIZE):
+        candidates = [
+            deposit_data
+            for deposit_data in deposit_datum[i : i + REGISTRATIONS_CHECK_BATCH_SIZE]
+            if deposit_data["public_key"].lower() not in used_pubkeys
+        ]
+        if not candidates:
             continue
 
-        selected_deposit_data = deposit_datum[deposit_data_index]
-        public_key = selected_deposit_data["public_key"]
-        can_register = public_key not in used_pubkeys and await can_register_validator(
-            block_number, public_key
+        registered_pubkeys = await get_registered_public_keys(
+            block_number, [deposit_data["public_key"] for deposit_data in candidates]
         )
-        while deposit_data_index < max_deposit_data_index and not can_register:
-            # the edge case when the validator was registered in previous merkle root
-            # and the deposit data is presented in the same.
-            deposit_data_index += 1
-            selected_deposit_data = deposit_datum[deposit_data_index]
-            public_key = selected_deposit_data["public_key"]
-            can_register = (
-                public_key not in used_pubkeys
-                and await can_register_validator(block_number, public_key)
-            )
+        for deposit_data in candidates:
+            if deposit_data["public_key"].lower() not in registered_pubkeys:
+                return deposit_data
 
-        if can_register:
-            return ValidatorDepositData(
-                operator=operator_address,
-                public_key=selected_deposit_data["public_key"],
-                withdrawal_credentials=selected_deposit_data["withdrawal_credentials"],
-                deposit_data_root=selected_deposit_data["deposit_data_root"],
-                deposit_data_signature=selected_deposit_data["signature"],
-                proof=selected_deposit_data["proof"],
-            )
     return None
 
 
-async def can_register_validator(block_number: BlockNumber, public_key: HexStr) -> bool:
-    """Checks whether it's safe to register the validator."""
+async def get_registered_public_keys(
+    block_number: BlockNumber, public_keys: List[HexStr]
+) -> Set[HexStr]:
+    """Fetches public keys that have been already registered."""
     result: Dict = await execute_ethereum_gql_query(
         network=NETWORK,
         query=VALIDATOR_REGISTRATIONS_QUERY,
-        variables=dict(block_number=block_number, public_key=public_key),
+        variables=dict(block_number=block_number, public_keys=public_keys),
+    )
+    return set(
+        registration["publicKey"].lower()
+        for registration in result["validatorRegistrations"]
     )
-    registrations = result["validatorRegistrations"]
-
-    return len(registrations) == 0
 
 
 async def get_validators_deposit_root(block_number: BlockNumber) -> HexStr:
     """Fetches validators deposit root for protecting against operator submitting deposit prior to registration."""
+    if block_number in VALIDATORS_DEPOSIT_ROOT_CACHE:
+        return VALIDATORS_DEPOSIT_ROOT_CACHE[block_number]
+
     result: Dict = await execute_ethereum_gql_query(
         network=NETWORK,
         query=VALIDATOR_REGISTRATIONS_LATEST_INDEX_QUERY,
         variables=dict(block_number=block_number),
     )
-    return result["validatorRegistrations"][0]["validatorsDepositRoot"]
+    validators_deposit_root = result["validatorRegistrations"][0][
+        "validatorsDepositRoot"
+    ]
+    VALIDATORS_DEPOSIT_ROOT_CACHE[block_number] = validators_deposit_root
+    return validators_deposit_root
 
 
 def _move_to_bottom(operators, operator_id):
@@ -120,9 +167,9 @@ def _move_to_bottom(operators, operator_id):
 
 def _find_operator_index(operators, operator_id):
     index = None
-    operator_id = Web3.toChecksumAddress(operator_id)
+    operator_id = to_checksum_address(operator_id)
     for i, operator in enumerate(operators):
-        if Web3.toChecksumAddress(operator["id"]) == operator_id:
+        if to_checksum_address(operator["id"]) == operator_id:
             index = i
             break
     return index
@@ -1,26 +1,33 @@
 from unittest.mock import patch
 
+import pytest
 from web3 import Web3
 from web3.types import BlockNumber
 
+from oracle.oracle.common.graphql_queries import (
+    OPERATORS_QUERY,
+    VALIDATOR_REGISTRATIONS_LATEST_INDEX_QUERY,
+)
 from oracle.oracle.tests.common import get_test_oracle
 from oracle.oracle.tests.factories import faker
 
 from ..controller import ValidatorsController
+from ..eth1 import VALIDATORS_DEPOSIT_ROOT_CACHE
 from ..types import ValidatorVotingParameters
 
 w3 = Web3()
 block_number = faker.random_int(150000, 250000)
 
 
-def select_operators(operator, *args, **kwargs):
+def select_operators(operator, operators_count=1, *args, **kwargs):
     return {
         "operators": [
             {
-                "id": operator,  # operator
+                "id": operator if i == 0 else faker.eth_address(),  # operator
                 "depositDataMerkleProofs": "/ipfs/" + faker.text(max_nb_chars=20),
                 "depositDataIndex": "5",
-            },
+            }
+            for i in range(operators_count)
         ]
     }
 
@@ -52,39 +59,28 @@ def ipfs_fetch(
     ] * 6
 
 
-def ipfs_fetch_query(
-    deposit_data_root,
-    public_key,
-    signature,
-    withdrawal_credentials,
-    proofs,
-):
-
-    return [
-        ipfs_fetch(
-            deposit_data_root, public_key, signature, withdrawal_credentials, proofs
-        )
-    ]
-
-
 def get_validators_deposit_root(validatorsDepositRoot, *args, **kwargs):
     return {
         "validatorRegistrations": [{"validatorsDepositRoot": validatorsDepositRoot}]
     }
 
 
-def sw_gql_query(operator):
-    return [
-        select_operators(operator),
-        select_validators(),
-    ]
+def sw_gql_query(operator, operators_count=1):
+    def _sw_gql_query(network, query, variables):
+        if query == OPERATORS_QUERY:
+            return select_operators(operator, operators_count)
+        return select_validators()
 
+    return _sw_gql_query
 
-def ethereum_gql_query(validatorsDepositRoot, *args, **kwargs):
-    return [
-        can_registor_validator(),
-        get_validators_deposit_root(validatorsDepositRoot),
-    ]
+
+def ethereum_gql_query(validatorsDepositRoot):
+    def _ethereum_gql_query(network, query, variables):
+        if query == VALIDATOR_REGISTRATIONS_LATEST_INDEX_QUERY:
+            return get_validators_deposit_root(validatorsDepositRoot)
+        return can_registor_validator()
+
+    return _ethereum_gql_query
 
 
 class TestValidatorController:
@@ -102,7 +98,8 @@ class TestValidatorController:
             )
             assert vote_mock.mock_calls == []
 
-    async def test_process_success(self):
+    @pytest.mark.parametrize("operators_count", [1, 10, 100])
+    async def test_process_success(self, operators_count):
         validators_nonce = faker.random_int(1000, 2000)
 
         vote = {
@@ -122,15 +119,20 @@ class TestValidatorController:
         }
         with patch(
             "oracle.oracle.validators.eth1.execute_sw_gql_query",
-            side_effect=sw_gql_query(operator=vote["deposit_data"][0]["operator"]),
+            side_effect=sw_gql_query(
+                operator=vote["deposit_data"][0]["operator"],
+                operators_count=operators_count,
+            ),
         ), patch(
             "oracle.oracle.validators.eth1.execute_ethereum_gql_query",
             side_effect=ethereum_gql_query(
                 validatorsDepositRoot=vote["validators_deposit_root"]
             ),
+        ), patch.dict(
+            VALIDATORS_DEPOSIT_ROOT_CACHE, clear=True
         ), patch(
             "oracle.oracle.validators.eth1.ipfs_fetch",
-            side_effect=ipfs_fetch_query(
+            return_value=ipfs_fetch(
                 deposit_data_root=vote["deposit_data"][0]["deposit_data_root"],
                 public_key=vote["deposit_data"][0]["public_key"],
                 signature=vote["deposit_data"][0]["deposit_data_signature"],
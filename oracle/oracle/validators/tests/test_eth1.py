@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pytest
+from web3.types import BlockNumber
+
+from oracle.oracle.common.graphql_queries import (
+    OPERATORS_QUERY,
+    VALIDATOR_REGISTRATIONS_QUERY,
+)
+from oracle.oracle.tests.factories import faker
+
+from ..eth1 import REGISTRATIONS_CHECK_BATCH_SIZE, select_validator
+
+DEPOSIT_DATA_COUNT = 2 * REGISTRATIONS_CHECK_BATCH_SIZE + 50
+
+operator = faker.eth_address()
+deposit_datum = [
+    {
+        "amount": str(32 * 10**9),
+        "deposit_data_root": faker.eth_proof(),
+        "proof": [faker.eth_proof()] * 6,
+        "public_key": "0x" + f"{i:096x}",
+        "signature": faker.eth_signature(),
+        "withdrawal_credentials": faker.eth_address(),
+    }
+    for i in range(DEPOSIT_DATA_COUNT)
+]
+
+
+def sw_gql_query(network, query, variables):
+    if query == OPERATORS_QUERY:
+        return {
+            "operators": [
+                {
+                    "id": operator,
+                    "depositDataMerkleProofs": "/ipfs/" + faker.text(max_nb_chars=20),
+                    "depositDataIndex": "0",
+                }
+            ]
+        }
+    return {"validators": []}
+
+
+def ethereum_gql_query(registered_pubkeys):
+    def _ethereum_gql_query(network, query, variables):
+        assert query == VALIDATOR_REGISTRATIONS_QUERY
+        assert len(variables["public_keys"]) <= REGISTRATIONS_CHECK_BATCH_SIZE
+        return {
+            "validatorRegistrations": [
+                {"publicKey": public_key.upper()}
+                for public_key in variables["public_keys"]
+                if public_key in registered_pubkeys
+            ]
+        }
+
+    return _ethereum_gql_query
+
+
+@pytest.mark.parametrize(
+    "used_indexes,registered_indexes,expected_index",
+    [
+        ([], [], 0),
+        ([0], [1, 2], 3),
+        # the first free key is past the first batch
+        ([0, 105], range(1, 105), 106),
+        ([], range(DEPOSIT_DATA_COUNT), None),
+    ],
+)
+async def test_select_validator(used_indexes, registered_indexes, expected_index):
+    used_pubkeys = set(deposit_datum[i]["public_key"].upper() for i in used_indexes)
+    registered_pubkeys = set(deposit_datum[i]["public_key"] for i in registered_indexes)
+    with patch(
+        "oracle.oracle.validators.eth1.execute_sw_gql_query",
+        side_effect=sw_gql_query,
+    ), patch(
+        "oracle.oracle.validators.eth1.execute_ethereum_gql_query",
+        side_effect=ethereum_gql_query(registered_pubkeys),
+    ) as registrations_mock, patch(
+        "oracle.oracle.validators.eth1.ipfs_fetch", return_value=deposit_datum
+    ):
+        validator = await select_validator(BlockNumber(14583706), used_pubkeys)
+
+    if expected_index is None:
+        assert validator is None
+        return
+
+    assert validator["public_key"] == deposit_datum[expected_index]["public_key"]
+    assert validator["operator"] == operator
+    assert registrations_mock.call_count == (
+        expected_index // REGISTRATIONS_CHECK_BATCH_SIZE + 1
+    )
@@ -1,12 +1,14 @@
+import asyncio
 import json
 import logging
+from functools import lru_cache
 from typing import Union
 
 import backoff
 import boto3
 from eth_account.messages import encode_defunct
 from eth_account.signers.local import LocalAccount
-from web3 import Web3
+from eth_hash.auto import keccak
 
 from oracle.oracle.distributor.common.types import DistributorVote
 from oracle.oracle.rewards.types import RewardVote
@@ -16,32 +18,48 @@ from oracle.settings import NETWORK_CONFIG
 logger = logging.getLogger(__name__)
 
 
-@backoff.on_exception(backoff.expo, Exception, max_time=900)
-def submit_vote(
+async def submit_vote(
     oracle: LocalAccount,
     encoded_data: bytes,
     vote: Union[RewardVote, DistributorVote, ValidatorsVote],
     name: str,
 ) -> None:
     """Submits vote to the votes' aggregator."""
-    aws_bucket_name = NETWORK_CONFIG["AWS_BUCKET_NAME"]
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=NETWORK_CONFIG["AWS_ACCESS_KEY_ID"],
-        aws_secret_access_key=NETWORK_CONFIG["AWS_SECRET_ACCESS_KEY"],
-    )
     # generate candidate ID
-    candidate_id: bytes = Web3.keccak(primitive=encoded_data)
+    candidate_id: bytes = keccak(encoded_data)
     message = encode_defunct(primitive=candidate_id)
     signed_message = oracle.sign_message(message)
     vote["signature"] = signed_message.signature.hex()
 
     # TODO: support more aggregators (GCP, Azure, etc.)
-    bucket_key = f"{oracle.address}/{name}"
-    s3_client.put_object(
-        Bucket=aws_bucket_name,
+    await upload_vote(
+        bucket_key=f"{oracle.address}/{name}",
+        body=json.dumps(vote, separators=(",", ":")).encode(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_s3_client(aws_access_key_id: str, aws_secret_access_key: str):
+    """Returns S3 client, the client is created once and reused between votes."""
+    return boto3.client(
+        "s3",
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+    )
+
+
+@backoff.on_exception(backoff.expo, Exception, max_time=900)
+async def upload_vote(bucket_key: str, body: bytes) -> None:
+    """Uploads signed vote to the S3 bucket."""
+    s3_client = get_s3_client(
+        aws_access_key_id=NETWORK_CONFIG["AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=NETWORK_CONFIG["AWS_SECRET_ACCESS_KEY"],
+    )
+    # S3 provides read-after-write consistency, no need to wait for the object
+    await asyncio.to_thread(
+        s3_client.put_object,
+        Bucket=NETWORK_CONFIG["AWS_BUCKET_NAME"],
         Key=bucket_key,
-        Body=json.dumps(vote),
+        Body=body,
         ACL="public-read",
     )
-    s3_client.get_waiter("object_exists").wait(Bucket=aws_bucket_name, Key=bucket_key)
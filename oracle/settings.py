@@ -29,6 +29,11 @@ CONFIRMATION_BLOCKS: int = config("CONFIRMATION_BLOCKS", default=15, cast=int)
 # oracle
 ORACLE_PROCESS_INTERVAL = config("ORACLE_PROCESS_INTERVAL", default=15, cast=int)
 
+# maximum number of concurrent beacon node requests for the validators balances
+VALIDATORS_FETCH_CONCURRENCY = config(
+    "VALIDATORS_FETCH_CONCURRENCY", default=10, cast=int
+)
+
 IPFS_FETCH_ENDPOINTS = config(
     "IPFS_FETCH_ENDPOINTS",
     cast=Csv(),